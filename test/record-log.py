@@ -4,15 +4,16 @@ record-log.py
 
 Robust NPG-Lite BLE streamer with CSV fixes and automatic disconnect handling:
  - auto-connect (or supply --device-address)
- - try to request MTU=500 (if supported)
+ - try to request MTU=500 (if supported) and warn if a batch won't fit in one notification
  - send "START" automatically
- - reassemble partial notifications into 7-byte samples
- - accumulate samples and write batches to CSV
- - flush & fsync after each batch write
+ - reassemble partial notifications into batches of 7-byte samples
+ - parse whole batches with numpy and write them to CSV from a background task
+ - write durably every few seconds (or every 64 KB) and on shutdown
+   (O_DSYNC on Linux, fsync after each write elsewhere)
  - write leftover partial samples on shutdown
  - exit automatically on BLE disconnect
  - save summary.txt with statistics in IST timezone
- - print BLE notification size for each packet received
+ - print a status line every few seconds (per-packet/batch lines with --verbose)
  - hardcoded streaming duration timer (tracks data streaming time)
 
 Usage:
@@ -21,13 +22,13 @@ Usage:
 
 import argparse
 import asyncio
-import csv
 import os
 import sys
 import time
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 
+import numpy as np
 from bleak import BleakScanner, BleakClient
 
 try:
@@ -49,6 +50,29 @@ SINGLE_SAMPLE_LEN = 7      # 1 counter + 3*2 bytes (big-endian)
 BLOCK_COUNT = 25
 NEW_PACKET_LEN = BLOCK_COUNT * SINGLE_SAMPLE_LEN
 SAMP_RATE = 250.0          # per-channel sampling rate (Hz)
+MIN_BATCH_MTU = NEW_PACKET_LEN + 3  # ATT notify header + one full batch per notification
+SAMPLE_PERIOD_US = round(1_000_000 / SAMP_RATE)  # 4000 us between samples
+
+# Packed on-wire sample layout: uint8 counter + 3 big-endian uint16 channels
+SAMPLE_DTYPE = np.dtype([("counter", "u1"), ("ch0", ">u2"), ("ch1", ">u2"), ("ch2", ">u2")])
+
+# ----- CSV layout -----
+CSV_HEADER = b"timestamp_unix,counter,ch0,ch1,ch2\n"
+CSV_ROW_FMT = b"%d.%06d,%d,%d,%d,%d\n"   # timestamp as integer seconds + microseconds
+CSV_ROW_FIELDS = 6
+
+# ----- Durability: durable write() when either threshold is crossed -----
+WRITE_INTERVAL_S = 5.0
+WRITE_CHUNK_BYTES = 64 * 1024  # rendered rows are held in memory until this much is pending
+# On Linux each write() is made durable by O_DSYNC; elsewhere an fsync follows each write()
+USE_O_DSYNC = sys.platform.startswith("linux") and hasattr(os, "O_DSYNC")
+
+# ----- Background CSV writer -----
+WRITE_QUEUE_SIZE = 64      # batches buffered between BLE callback and writer task
+WRITER_MAX_COALESCE = 32   # max queued batches the writer renders per write_batches() call
+
+# ----- Console logging -----
+STATUS_INTERVAL_S = 5.0    # seconds between [STATUS] lines (per-packet lines need --verbose)
 
 # ---- Utility: call attribute that may be property / callable / coroutine ----
 async def call_maybe_async(obj, method_name: str, *args, **kwargs):
@@ -62,68 +86,125 @@ async def call_maybe_async(obj, method_name: str, *args, **kwargs):
         return res
     return attr
 
-# ---- CSV writer with flush+fsync ----
+# ---- CSV writer with chunked, durable os.write ----
 class CSVWriter:
-    def __init__(self, path: str):
+    def __init__(self, path: str, verbose: bool = False):
         # ensure directory exists
         d = os.path.dirname(os.path.abspath(path))
         if d and not os.path.exists(d):
             os.makedirs(d, exist_ok=True)
         # open file
         self.path = path
+        self.verbose = verbose
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND | getattr(os, "O_BINARY", 0)
+        self.dsync = USE_O_DSYNC
+        if self.dsync:
+            flags |= os.O_DSYNC
         try:
-            self.f = open(path, "w", newline="")
+            self.fd = os.open(path, flags, 0o644)
         except Exception as e:
             raise RuntimeError(f"Failed to open CSV file {path!r}: {e}")
-        self.writer = csv.writer(self.f)
-        self.writer.writerow(["timestamp_unix", "counter", "ch0", "ch1", "ch2"])
-        self.f.flush()
-        try:
-            os.fsync(self.f.fileno())
-        except Exception:
-            pass
+        self.out_buf = bytearray()            # rendered rows not yet passed to os.write
+        self.out_buf += CSV_HEADER
+        self._write_out()
+        # per-sample offsets from the batch receive time (last sample = 0), plus scratch output
+        self._offsets_us = (BLOCK_COUNT - 1 - np.arange(BLOCK_COUNT, dtype=np.int64)) * SAMPLE_PERIOD_US
+        self._times_scratch = np.empty(BLOCK_COUNT, dtype=np.int64)
+        self.last_write = time.monotonic()
         self.closed = False
 
-    def write_batch(self, samples: List[dict], t_recv: float):
-        """Write list of samples (any length) and flush+fsync after writing."""
+    def _write_out(self):
+        """Pass all buffered bytes to the OS, retrying on short writes, and make them durable"""
+        written = 0
+        try:
+            with memoryview(self.out_buf) as view:
+                while written < len(view):
+                    # release each slice explicitly so an exception traceback
+                    # cannot keep out_buf exported (and un-resizable)
+                    with view[written:] as chunk:
+                        written += os.write(self.fd, chunk)
+        finally:
+            # drop whatever reached the OS so a retry resumes where this one stopped
+            del self.out_buf[:written]
+        # with O_DSYNC, write() only returns once the data is on disk
+        if not self.dsync:
+            try:
+                os.fsync(self.fd)
+            except Exception:
+                # non-fatal: continue
+                pass
+
+    def write_batches(self, batches: List[Tuple[np.ndarray, float]]):
+        """Render several (samples, t_recv) batches, then write once enough data is pending."""
+        n_total = 0
+        for samples, t_recv in batches:
+            n_total += self._render_batch(samples, t_recv)
+        if n_total == 0:
+            return
+        # write only every WRITE_CHUNK_BYTES or WRITE_INTERVAL_S
+        now = time.monotonic()
+        wrote = len(self.out_buf) >= WRITE_CHUNK_BYTES or now - self.last_write >= WRITE_INTERVAL_S
+        if wrote:
+            n_bytes = len(self.out_buf)
+            self._write_out()
+            self.last_write = now
+        if self.verbose:
+            last_counter = int(batches[-1][0]["counter"][-1])
+            if wrote:
+                print(f"[CSV] Wrote {n_bytes} bytes to {self.path} (last_counter={last_counter})")
+            else:
+                print(f"[CSV] Buffered {n_total} samples ({len(batches)} batch(es)); {len(self.out_buf)} bytes pending (last_counter={last_counter})")
+
+    def _render_batch(self, samples: np.ndarray, t_recv: float) -> int:
+        """Append one batch as CSV rows to out_buf; returns the number of rows"""
         n = len(samples)
         if n == 0:
-            return
-        dt = 1.0 / SAMP_RATE
-        for k, s in enumerate(samples):
-            sample_time = t_recv - (n - 1 - k) * dt
-            self.writer.writerow([f"{sample_time:.6f}", s["counter"], s["ch0"], s["ch1"], s["ch2"]])
-        # flush & fsync so data is physically saved now
-        try:
-            self.f.flush()
-            os.fsync(self.f.fileno())
-        except Exception:
-            # non-fatal: continue
-            pass
-        print(f"[CSV] Wrote {n} samples to {self.path} (last_counter={samples[-1]['counter']})")
+            return 0
+        # timestamps in integer microseconds, split into seconds + fraction so that
+        # rows need only integer formatting (no per-row float conversion)
+        # batches are BLOCK_COUNT samples, shutdown leftovers fewer
+        assert n <= BLOCK_COUNT, f"batch of {n} samples exceeds BLOCK_COUNT"
+        t_recv_us = round(t_recv * 1_000_000)
+        sample_us = np.subtract(t_recv_us, self._offsets_us[BLOCK_COUNT - n:], out=self._times_scratch[:n])
+        secs, usecs = np.divmod(sample_us, 1_000_000)
+        # interleave columns into one flat list and format all rows in a single pass
+        values = [None] * (CSV_ROW_FIELDS * n)
+        values[0::CSV_ROW_FIELDS] = secs.tolist()
+        values[1::CSV_ROW_FIELDS] = usecs.tolist()
+        values[2::CSV_ROW_FIELDS] = samples["counter"].tolist()
+        values[3::CSV_ROW_FIELDS] = samples["ch0"].tolist()
+        values[4::CSV_ROW_FIELDS] = samples["ch1"].tolist()
+        values[5::CSV_ROW_FIELDS] = samples["ch2"].tolist()
+        self.out_buf += (CSV_ROW_FMT * n) % tuple(values)
+        return n
 
     def close(self):
         if not self.closed:
             try:
-                self.f.flush()
+                self._write_out()
+            except Exception:
+                pass
+            finally:
                 try:
-                    os.fsync(self.f.fileno())
+                    os.close(self.fd)
                 except Exception:
                     pass
-                self.f.close()
-            except Exception:
-                pass
             self.closed = True
 
-# ---- NPG client: handles reassembly, batching, and CSV writes ----
+# ---- NPG client: handles reassembly, batching, and queues CSV writes ----
 class NPGClient:
-    def __init__(self, device_address: Optional[str] = None, name_prefix: str = "NPG", csv_out: Optional[str] = None, duration_minutes: int = DEFAULT_STREAMING_DURATION_MINUTES):
+    def __init__(self, device_address: Optional[str] = None, name_prefix: str = "NPG", csv_out: Optional[str] = None, duration_minutes: int = DEFAULT_STREAMING_DURATION_MINUTES, verbose: bool = False):
         self.device_address = device_address
         self.name_prefix = name_prefix
         self.client: Optional[BleakClient] = None
-        self.rx_buffer = bytearray()          # staging buffer for partial sample bytes
-        self.sample_accum: List[dict] = []    # accumulate parsed samples until BLOCK_COUNT
-        self.csv_writer = CSVWriter(csv_out) if csv_out else None
+        self.batch_buf = bytearray(NEW_PACKET_LEN)  # reusable staging buffer for one batch of raw samples
+        self.batch_fill = 0                   # number of bytes currently held in batch_buf
+        self.verbose = verbose                # print per-notification/per-batch lines
+        self.last_status_time = 0.0           # t_recv of the last [STATUS] line
+        self.csv_writer = CSVWriter(csv_out, verbose=verbose) if csv_out else None
+        self.write_q: asyncio.Queue = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)  # (samples, t_recv) batches for the writer task
+        self.writer_task: Optional[asyncio.Task] = None
+        self.write_future: Optional[asyncio.Future] = None  # in-flight write_batches() in the executor
         self.last_recv_time = None            # timestamp of last received notification
         self.duration_minutes = duration_minutes  # Streaming duration in minutes
 
@@ -153,62 +234,111 @@ class NPGClient:
                 return d.address
         raise RuntimeError("No matching NPG device found. Try increasing scan timeout or provide --device-address.")
 
-    def _parse_one_sample(self, seven: bytes) -> dict:
-        """Parse a 7-byte sample into dict"""
-        if len(seven) != SINGLE_SAMPLE_LEN:
+    def _parse_samples(self, buf: bytearray, count: int) -> np.ndarray:
+        """Parse the first `count` 7-byte samples of `buf` into a structured array"""
+        if count * SINGLE_SAMPLE_LEN > len(buf):
             raise ValueError("Invalid sample length")
-        counter = seven[0]
-        ch0 = (seven[1] << 8) | seven[2]
-        ch1 = (seven[3] << 8) | seven[4]
-        ch2 = (seven[5] << 8) | seven[6]
-        return {"counter": counter, "ch0": ch0, "ch1": ch1, "ch2": ch2}
-
-    def _update_statistics(self, sample: dict, t_recv: float):
-        """Update tracking statistics for each sample"""
-        # Track first and last sample times
+        # copy so the parsed batch does not alias the reused batch_buf
+        return np.frombuffer(buf, dtype=SAMPLE_DTYPE, count=count).copy()
+
+    def _handle_complete_batch(self, samples: np.ndarray, t_recv: float):
+        # Update statistics once per batch
         if self.first_sample_time is None:
             self.first_sample_time = t_recv
         self.last_sample_time = t_recv
+        self.total_samples += len(samples)
 
-        # Increment total samples
-        self.total_samples += 1
-
-        # Detect missing samples using counter (0-255 rolling)
-        current_counter = sample["counter"]
+        # Detect missing samples using counter (0-255 rolling): each step should be +1 mod 256,
+        # so (step - 1) & 0xFF is the number of samples skipped before that sample
+        counters = samples["counter"].astype(np.int16)
         if self.last_counter is not None:
-            expected_counter = (self.last_counter + 1) % 256
-            if current_counter != expected_counter:
-                # Calculate how many samples were missed
-                if current_counter > expected_counter:
-                    missed = current_counter - expected_counter
-                else:
-                    missed = (256 - expected_counter) + current_counter
-                self.missing_samples += missed
-                print(f"[WARNING] Detected {missed} missing samples (expected counter {expected_counter}, got {current_counter})")
-
-        self.last_counter = current_counter
-
-    def _handle_complete_batch(self, samples: List[dict], t_recv: float):
-        # Update statistics for each sample in batch
-        for sample in samples:
-            self._update_statistics(sample, t_recv)
-
-        # Calculate elapsed time since streaming started
-        if self.streaming_start_time is not None:
-            elapsed = t_recv - self.streaming_start_time
-            elapsed_str = self._format_elapsed_time(elapsed)
+            steps = np.diff(counters, prepend=self.last_counter)
         else:
-            elapsed_str = "00:00:00"
-
-        # print a compact summary and write to CSV if requested
-        last = samples[-1]
-        print(f"[BATCH] {len(samples)} samples; last_counter={last['counter']}; elapsed={elapsed_str}")
+            steps = np.diff(counters)
+        missed = int(((steps - 1) & 0xFF).sum())
+        self.last_counter = int(counters[-1])
+        if missed:
+            self.missing_samples += missed
+            print(f"[WARNING] Detected {missed} missing samples in batch (last_counter={self.last_counter})")
+
+        # print per-batch detail only if verbose, otherwise a periodic status line
+        status_due = t_recv - self.last_status_time >= STATUS_INTERVAL_S
+        if self.verbose or status_due:
+            # Calculate elapsed time since streaming started
+            if self.streaming_start_time is not None:
+                elapsed = t_recv - self.streaming_start_time
+                elapsed_str = self._format_elapsed_time(elapsed)
+            else:
+                elapsed_str = "00:00:00"
+            if self.verbose:
+                print(f"[BATCH] {len(samples)} samples; last_counter={self.last_counter}; elapsed={elapsed_str}")
+            if status_due:
+                self.last_status_time = t_recv
+                print(f"[STATUS] {self.total_samples} samples; missing={self.missing_samples}; elapsed={elapsed_str}")
+
+        # write to CSV if requested
         if self.csv_writer:
-            self.csv_writer.write_batch(samples, t_recv)
-
-
-    def on_data_notify(self, sender, data: bytearray):
+            # hand off to the writer task; never block the BLE callback on disk I/O
+            try:
+                self.write_q.put_nowait((samples, t_recv))
+            except asyncio.QueueFull:
+                print(f"[WARNING] CSV write queue full; dropped batch (last_counter={self.last_counter})", file=sys.stderr)
+
+    async def _csv_writer_loop(self):
+        """Background task: write queued batches to CSV until a None sentinel arrives"""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self.write_q.get()
+            # coalesce whatever else is already queued (bounded) into one write
+            batches = []
+            while item is not None:
+                batches.append(item)
+                if len(batches) >= WRITER_MAX_COALESCE:
+                    break
+                try:
+                    item = self.write_q.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+            if batches:
+                # run the blocking write/fsync in a worker thread so the event loop
+                # (and with it bleak's notification dispatch) keeps running
+                # (shielded: if this task is cancelled the thread still finishes, and
+                # _stop_writer waits for it before touching the CSVWriter)
+                self.write_future = loop.run_in_executor(None, self.csv_writer.write_batches, batches)
+                try:
+                    await asyncio.shield(self.write_future)
+                except Exception as e:
+                    print("[ERROR] CSV write failed:", e, file=sys.stderr)
+            if item is None:
+                break
+
+    async def _stop_writer(self):
+        """Let the writer task drain the queue and exit, then write anything it left behind"""
+        task, self.writer_task = self.writer_task, None
+        if task is not None and not task.done():
+            await self.write_q.put(None)
+            try:
+                await task
+            except asyncio.CancelledError:
+                # the writer was cancelled (e.g. Ctrl-C on Python < 3.11); only
+                # propagate if it is this coroutine that is being cancelled
+                if not task.done():
+                    raise
+        # wait for a write the cancelled writer left running in the executor
+        if self.write_future is not None and not self.write_future.done():
+            await asyncio.wait([self.write_future])
+        # drain whatever is still queued
+        batches = []
+        while not self.write_q.empty():
+            item = self.write_q.get_nowait()
+            if item is not None:
+                batches.append(item)
+        if batches:
+            self.csv_writer.write_batches(batches)
+
+    def on_data_notify(self, sender, data: Union[bytes, bytearray, memoryview]):
         """Notification callback: reassemble bytes into 7-byte samples, accumulate batches."""
+        # the only clock read on the data path; everything downstream derives from t_recv
         t_recv = time.time()
         self.last_recv_time = t_recv
 
@@ -219,30 +349,27 @@ class NPGClient:
 
         # Print notification size
         notification_size = len(data)
-        print(f"[BLE] Notification received: {notification_size} bytes")
-
-        # Append incoming bytes to staging buffer
-        self.rx_buffer.extend(bytes(data))
-
-        # While we have at least 7 bytes, parse one sample
-        while len(self.rx_buffer) >= SINGLE_SAMPLE_LEN:
-            seven = bytes(self.rx_buffer[:SINGLE_SAMPLE_LEN])
-            # remove consumed bytes
-            del self.rx_buffer[:SINGLE_SAMPLE_LEN]
+        if self.verbose:
+            print(f"[BLE] Notification received: {notification_size} bytes")
+
+        # Copy incoming bytes into the batch buffer; parse and hand off each time it fills.
+        # Slicing a memoryview avoids an intermediate copy of each piece.
+        view = memoryview(data)
+        pos = 0
+        while pos < notification_size:
+            take = min(NEW_PACKET_LEN - self.batch_fill, notification_size - pos)
+            self.batch_buf[self.batch_fill:self.batch_fill + take] = view[pos:pos + take]
+            self.batch_fill += take
+            pos += take
+            if self.batch_fill < NEW_PACKET_LEN:
+                break
+            self.batch_fill = 0
             try:
-                sample = self._parse_one_sample(seven)
+                samples = self._parse_samples(self.batch_buf, BLOCK_COUNT)
             except Exception as e:
-                print("Failed to parse 7-byte sample:", e, file=sys.stderr)
+                print("Failed to parse samples:", e, file=sys.stderr)
                 continue
-            self.sample_accum.append(sample)
-
-            # If we have a full batch, handle it
-            if len(self.sample_accum) >= BLOCK_COUNT:
-                # take first BLOCK_COUNT samples
-                batch = self.sample_accum[:BLOCK_COUNT]
-                del self.sample_accum[:BLOCK_COUNT]
-                # handle batch write
-                self._handle_complete_batch(batch, t_recv)
+            self._handle_complete_batch(samples, t_recv)
 
     def on_control_notify(self, sender, data: bytearray):
         try:
@@ -306,6 +433,10 @@ class NPGClient:
             print(f"[ERROR] Failed to write summary: {e}", file=sys.stderr)
 
     async def connect_and_start(self):
+        # start the CSV writer before any notification can arrive
+        if self.csv_writer and self.writer_task is None:
+            self.writer_task = asyncio.create_task(self._csv_writer_loop())
+
         addr = await self.find_device()
         print("Connecting to", addr)
 
@@ -338,6 +469,7 @@ class NPGClient:
                     break
             except Exception:
                 pass
+        await self._check_mtu()
 
         # start notify on data & control characteristics
         try:
@@ -362,6 +494,32 @@ class NPGClient:
         await self._safe_write_control(b"START")
         print("Sent START command; streaming should begin shortly (if firmware accepted START).")
 
+    async def _check_mtu(self):
+        """Log the negotiated MTU and warn if a batch gets split across notifications"""
+        # BlueZ only reports the real MTU after it has been acquired (best-effort);
+        # until then mtu_size returns the 23-byte default, which was never negotiated
+        backend = getattr(self.client, "_backend", None)
+        acquire = getattr(backend, "_acquire_mtu", None)
+        if callable(acquire):
+            try:
+                maybe = acquire()
+                if asyncio.iscoroutine(maybe):
+                    await maybe
+            except Exception:
+                pass
+            # a failed acquire leaves _mtu_size unset as well
+            if getattr(backend, "_mtu_size", None) is None:
+                print("Negotiated MTU: unknown")
+                return
+        try:
+            mtu = int(getattr(self.client, "mtu_size"))
+        except Exception:
+            print("Negotiated MTU: unknown")
+            return
+        print(f"Negotiated MTU: {mtu}")
+        if mtu < MIN_BATCH_MTU:
+            print(f"[WARNING] MTU {mtu} < {MIN_BATCH_MTU}: each {NEW_PACKET_LEN}-byte batch will arrive in several notifications", file=sys.stderr)
+
     async def _safe_write_control(self, payload: bytes):
         if not self.client:
             raise RuntimeError("Not connected")
@@ -387,14 +545,12 @@ class NPGClient:
     async def disconnect(self):
         # on shutdown, write remaining partial samples if any
         try:
-            if self.sample_accum and self.last_recv_time:
-                print(f"[SHUTDOWN] Writing leftover {len(self.sample_accum)} sample(s) to CSV")
-                if self.csv_writer:
-                    # Update statistics for leftover samples
-                    for sample in self.sample_accum:
-                        self._update_statistics(sample, self.last_recv_time)
-                    # Write to CSV
-                    self.csv_writer.write_batch(self.sample_accum, self.last_recv_time)
+            n_left = self.batch_fill // SINGLE_SAMPLE_LEN
+            if n_left and self.last_recv_time:
+                print(f"[SHUTDOWN] Writing leftover {n_left} sample(s) to CSV")
+                leftover = self._parse_samples(self.batch_buf, n_left)
+                # Update statistics and queue for the writer task like any other batch
+                self._handle_complete_batch(leftover, self.last_recv_time)
         except Exception as e:
             print("Error while writing leftovers:", e, file=sys.stderr)
 
@@ -422,7 +578,13 @@ class NPGClient:
             except Exception:
                 pass
         if self.csv_writer:
-            self.csv_writer.close()
+            try:
+                await self._stop_writer()
+            finally:
+                # always flush out_buf and close, even if stopping the writer was cancelled.
+                # The close runs off the event loop and is shielded so it finishes regardless.
+                close_future = asyncio.get_running_loop().run_in_executor(None, self.csv_writer.close)
+                await asyncio.shield(close_future)
 
 # ---- main ----
 async def main(args):
@@ -430,7 +592,7 @@ async def main(args):
         print("Error: --outfile is required to save CSV. Use --outfile data.csv", file=sys.stderr)
         return 1
 
-    client = NPGClient(device_address=args.device_address, name_prefix=args.device_name_prefix, csv_out=args.outfile, duration_minutes=args.duration)
+    client = NPGClient(device_address=args.device_address, name_prefix=args.device_name_prefix, csv_out=args.outfile, duration_minutes=args.duration, verbose=args.verbose)
 
     try:
         await client.connect_and_start()
@@ -483,6 +645,9 @@ Examples:
 
   Custom device name and duration:
     python record-log.py --outfile data.csv --device-name-prefix MYNPG --duration 60
+
+  Per-packet logging:
+    python record-log.py --outfile data.csv --verbose
         """)
     parser.add_argument("--outfile", type=str, required=True, help="CSV file path to save recorded data (required)")
     parser.add_argument("--duration", type=int, default=DEFAULT_STREAMING_DURATION_MINUTES, 
@@ -491,6 +656,8 @@ Examples:
                         help="Specific BLE device address to connect to (skips scanning)")
     parser.add_argument("--device-name-prefix", type=str, default="NPG", 
                         help="Device name prefix to scan for (default: NPG)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Print every BLE notification, batch and CSV write (default: status line every few seconds)")
     args = parser.parse_args()
 
     try: